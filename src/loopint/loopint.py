@@ -19,7 +19,8 @@ Examples:
 from __future__ import annotations
 
 import operator
-from copy import copy
+from collections.abc import Iterable
+from itertools import accumulate
 from typing import Self, SupportsIndex, SupportsInt, override
 
 
@@ -31,10 +32,19 @@ class LoopInt(SupportsInt, SupportsIndex):
     "visible" integer value: `left + (internal_value % span)`.
     """
 
+    __slots__ = ("_LoopInt__current_number", "_LoopInt__offset", "_LoopInt__span", "_LoopInt__visible", "__weakref__")
+
     @staticmethod
-    def __check_int_like(obj: SupportsIndex) -> int:
-        """Convert an index-like object into a real integer using operator.index()."""
-        return operator.index(obj)
+    def __check_deltas(deltas: Iterable[SupportsIndex]) -> list[int]:
+        """Convert an iterable of step values into integers, rejecting LoopInt steps.
+
+        The iterable is consumed once; the checks run over the distinct element
+        types and `map`, so no Python-level loop touches every delta.
+        """
+        items = list(deltas)
+        if any(issubclass(delta_type, LoopInt) for delta_type in set(map(type, items))):
+            raise TypeError("LoopInt cannot be added to LoopInt; only integer-like values allowed")
+        return list(map(operator.index, items))
 
     def __init__(self, current_number: SupportsIndex, /, right: SupportsIndex, *, left: SupportsIndex = 0) -> None:
         """Initialize a LoopInt.
@@ -47,36 +57,49 @@ class LoopInt(SupportsInt, SupportsIndex):
         Raises:
             ValueError: If `right <= left`, producing a non-positive span.
         """
-        self.__offset = LoopInt.__check_int_like(left)
-        self.__span = LoopInt.__check_int_like(right) - self.__offset
-        self.__current_number = LoopInt.__check_int_like(current_number) - self.__offset
+        self.__offset = operator.index(left)
+        self.__span = operator.index(right) - self.__offset
+        self.__current_number = operator.index(current_number) - self.__offset
         if self.__span <= 0:
             raise ValueError("Left border must be less than right border")
         self.__current_number %= self.__span
+        self.__visible = self.__current_number + self.__offset
 
-    @property
-    def __with_offset(self) -> int:
-        """Internal helper returning the fully normalized visible value."""
-        return self.__current_number + self.__offset
+    @classmethod
+    def _fast_new(cls, current_number: int, offset: int, span: int) -> Self:
+        """Build an instance from already validated internal state, bypassing __init__.
+
+        `current_number` must already be normalized into [0; span).
+        """
+        obj = object.__new__(cls)
+        obj.__offset = offset
+        obj.__span = span
+        obj.__current_number = current_number
+        obj.__visible = current_number + offset
+        return obj
 
     @override
     def __int__(self) -> int:
         """Return the visible integer value of this LoopInt."""
-        return self.__with_offset
+        return self.__visible
 
     @override
     def __hash__(self) -> int:
-        """Hash consistent with the visible integer value."""
-        return hash(int(self))
+        """Hash consistent with the visible integer value.
+
+        The hash follows the current value, so a LoopInt must not be mutated
+        (`+=`, `-=`, `apply_deltas`) while it is stored in a set or used as a dict key.
+        """
+        return hash(self.__visible)
 
     def to_string(self) -> str:
         """Return the value cast to string (same as str(int(self)))."""
-        return str(int(self))
+        return str(self.__visible)
 
     @override
     def __index__(self) -> int:
         """Return the integer value for sequence indexing operations."""
-        return int(self)
+        return self.__visible
 
     @override
     def __eq__(self, other: object, /) -> bool:
@@ -87,12 +110,12 @@ class LoopInt(SupportsInt, SupportsIndex):
         - an int with the same value,
         - any object where `int(self) == other` is True.
         """
-        return int(self) == other
+        return self.__visible == other
 
     @property
     def value(self) -> int:
         """The visible integer value of this LoopInt."""
-        return int(self)
+        return self.__visible
 
     @property
     def left(self) -> int:
@@ -112,16 +135,16 @@ class LoopInt(SupportsInt, SupportsIndex):
     @override
     def __repr__(self) -> str:
         """Return a detailed representation including bounds and current value."""
-        return f"{type(self).__name__}(current_number={int(self)}, left_border={self.left}, right_border={self.right})"
+        return f"{type(self).__name__}(current_number={self.__visible}, left_border={self.left}, right_border={self.right})"
 
     @override
     def __format__(self, format_spec: str, /) -> str:
         """Format using the visible integer value."""
-        return format(int(self), format_spec)
+        return format(self.__visible, format_spec)
 
     def __copy__(self) -> LoopInt:
         """Return a shallow copy preserving bounds and current value."""
-        return LoopInt(int(self), left=self.left, right=self.right)
+        return LoopInt._fast_new(self.__current_number, self.__offset, self.__span)
 
     def __neg__(self) -> LoopInt:
         """Return the modular negation of this LoopInt.
@@ -138,7 +161,7 @@ class LoopInt(SupportsInt, SupportsIndex):
         Returns:
             LoopInt: A new LoopInt instance with the negated modular value.
         """
-        return LoopInt(-int(self), left=self.left, right=self.right)
+        return LoopInt._fast_new((-self.__visible - self.__offset) % self.__span, self.__offset, self.__span)
 
     def __iadd__(self, other: SupportsIndex, /) -> Self:
         """In-place addition with modular wrap-around.
@@ -149,9 +172,10 @@ class LoopInt(SupportsInt, SupportsIndex):
         if isinstance(other, LoopInt):
             raise TypeError("LoopInt cannot be added to LoopInt; only integer-like values allowed")
 
-        other_number = LoopInt.__check_int_like(other)
+        other_number = operator.index(other)
 
         self.__current_number = (self.__current_number + other_number) % self.__span
+        self.__visible = self.__current_number + self.__offset
 
         return self
 
@@ -164,28 +188,109 @@ class LoopInt(SupportsInt, SupportsIndex):
         if isinstance(other, LoopInt):
             raise TypeError("LoopInt cannot be added to LoopInt; only integer-like values allowed")
 
-        other_number = LoopInt.__check_int_like(other)
+        other_number = operator.index(other)
 
         self.__current_number = (self.__current_number - other_number) % self.__span
+        self.__visible = self.__current_number + self.__offset
 
         return self
 
     def __add__(self, other: SupportsIndex, /) -> LoopInt:
-        """Return a new LoopInt equal to self + other (non-mutating)."""
-        clone = copy(self)
-        clone += other
-        return clone
+        """Return a new LoopInt equal to self + other (non-mutating).
+
+        Raises:
+            TypeError: If `other` is a LoopInt (not allowed).
+        """
+        if isinstance(other, LoopInt):
+            raise TypeError("LoopInt cannot be added to LoopInt; only integer-like values allowed")
+
+        other_number = operator.index(other)
+
+        return LoopInt._fast_new((self.__current_number + other_number) % self.__span, self.__offset, self.__span)
 
     def __radd__(self, other: SupportsIndex, /) -> LoopInt:
         """Support int + LoopInt by delegating to the same interval as self."""
         return self + other
 
     def __sub__(self, other: SupportsIndex) -> LoopInt:
-        """Return a new LoopInt equal to self - other (non-mutating)."""
-        clone = copy(self)
-        clone -= other
-        return clone
+        """Return a new LoopInt equal to self - other (non-mutating).
+
+        Raises:
+            TypeError: If `other` is a LoopInt (not allowed).
+        """
+        if isinstance(other, LoopInt):
+            raise TypeError("LoopInt cannot be added to LoopInt; only integer-like values allowed")
+
+        other_number = operator.index(other)
+
+        return LoopInt._fast_new((self.__current_number - other_number) % self.__span, self.__offset, self.__span)
 
     def __rsub__(self, other: SupportsIndex, /) -> LoopInt:
         """Support int - LoopInt by delegating to the same interval as self."""
-        return -(self - other)
+        other_number = operator.index(other)
+
+        return LoopInt._fast_new(
+            (other_number - self.__visible - self.__offset) % self.__span, self.__offset, self.__span
+        )
+
+    def step_many(self, deltas: Iterable[SupportsIndex], /) -> list[int]:
+        """Return the visible values reached after applying each delta in turn (non-mutating).
+
+        This is the bulk equivalent of repeatedly doing `x += delta` on a copy and
+        recording `int(x)` after every step, computed from running sums with one
+        modulo per step and no intermediate LoopInt instances.
+
+        Example:
+            x = LoopInt(3, right=5)
+            assert x.step_many([1, 1, 1, -4]) == [4, 0, 1, 2]
+
+        Raises:
+            TypeError: If any delta is a LoopInt (not allowed).
+        """
+        current, offset, span = self.__current_number, self.__offset, self.__span
+        return [offset + (current + total) % span for total in accumulate(LoopInt.__check_deltas(deltas))]
+
+    def apply_deltas(self, deltas: Iterable[SupportsIndex], /) -> Self:
+        """Apply every delta in place, as repeated `x += delta` would, and return self.
+
+        Modular addition is associative, so the deltas are summed first and the
+        result is wrapped with a single modulo.
+
+        Example:
+            x = LoopInt(3, right=5)
+            x.apply_deltas([1, 1, 1, -4])
+            assert int(x) == 2
+
+        Raises:
+            TypeError: If any delta is a LoopInt (not allowed).
+        """
+        self.__current_number = (self.__current_number + sum(LoopInt.__check_deltas(deltas))) % self.__span
+        self.__visible = self.__current_number + self.__offset
+
+        return self
+
+    def fold_range(self, start: SupportsIndex, stop: SupportsIndex, /) -> list[int]:
+        """Return every integer of `range(start, stop)` wrapped into this interval.
+
+        The result equals `[int(LoopInt(i, left=self.left, right=self.right)) for i in range(start, stop)]`,
+        but is built from at most one rotated period of the interval (repeated when
+        the range is longer than the span) instead of reducing each number separately.
+
+        Example:
+            x = LoopInt(0, right=3)
+            assert x.fold_range(-2, 5) == [1, 2, 0, 1, 2, 0, 1]
+        """
+        start_number = operator.index(start)
+        count = operator.index(stop) - start_number
+        if count <= 0:
+            return []
+
+        offset, span = self.__offset, self.__span
+        first = offset + (start_number - offset) % span
+        if count <= span:
+            head = range(first, min(first + count, offset + span))
+            return [*head, *range(offset, offset + count - len(head))]
+
+        period = [*range(first, offset + span), *range(offset, first)]
+        full, rest = divmod(count, span)
+        return period * full + period[:rest]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import weakref
+from collections.abc import Iterator
 from copy import copy
 
 import pytest
@@ -192,3 +194,131 @@ def test_rsub_int_minus_loopint() -> None:
     assert int(0 - x) == 4  # 0 - 1 = -1 → 4 mod 5
     assert int(-2 - x) == 2  # -2 - 1 = -3 → 2 mod 5
     assert int(10 - x) == 4  # 10 - 1 = 9 → 4 mod 5
+
+
+def test_instances_have_no_dict() -> None:
+    loop = LoopInt(0, right=5)
+    assert not hasattr(loop, "__dict__")
+
+
+def test_instances_support_weak_references() -> None:
+    loop = LoopInt(3, right=7, left=2)
+    ref = weakref.ref(loop)
+    assert ref() is loop
+
+
+def test_visible_value_tracks_in_place_mutation() -> None:
+    loop = LoopInt(3, right=5, left=-1)
+
+    loop += 2  # 3 + 2 = 5 -> -1 in [-1; 5)
+    assert int(loop) == -1
+    assert loop == -1
+    assert hash(loop) == hash(-1)
+    assert f"{loop}" == "-1"
+    assert ["a", "b", "c"][loop] == "c"
+
+    loop -= 1  # -1 - 1 = -2 -> 4 in [-1; 5)
+    assert loop.value == 4
+    assert loop.to_string() == "4"
+    assert "current_number=4" in repr(loop)
+
+
+def test_step_many_reports_each_step_without_mutating() -> None:
+    loop = LoopInt(3, right=5)
+    assert loop.step_many([1, 1, 1, -4]) == [4, 0, 1, 2]
+    assert loop.step_many([]) == []
+    assert int(loop) == 3
+
+    offset_loop = LoopInt(0, right=2, left=-1)
+    assert offset_loop.step_many(range(4)) == [0, 1, 0, 0]
+
+
+def test_step_many_accepts_generator() -> None:
+    loop = LoopInt(3, right=5)
+    assert loop.step_many(delta for delta in (1, 1, 1, -4)) == [4, 0, 1, 2]
+
+
+def test_step_many_rejects_loopint_delta() -> None:
+    loop = LoopInt(0, right=5)
+    with pytest.raises(TypeError):
+        _ = loop.step_many([1, LoopInt(1, right=5)])
+
+
+def test_fold_range_wraps_each_number() -> None:
+    loop = LoopInt(0, right=3)
+    assert loop.fold_range(-2, 5) == [1, 2, 0, 1, 2, 0, 1]
+    assert loop.fold_range(4, 4) == []
+    assert loop.fold_range(5, 2) == []
+
+    offset_loop = LoopInt(0, right=2, left=-1)
+    assert offset_loop.fold_range(0, 5) == [0, 1, -1, 0, 1]
+
+
+def test_fold_range_only_builds_requested_values_for_huge_span() -> None:
+    loop = LoopInt(0, right=2**40)
+    assert loop.fold_range(5, 8) == [5, 6, 7]
+    assert loop.fold_range(-2, 2) == [2**40 - 2, 2**40 - 1, 0, 1]
+
+    offset_loop = LoopInt(-1, right=0, left=-(2**40))
+    assert offset_loop.fold_range(-1, 2) == [-1, -(2**40), -(2**40) + 1]
+
+
+def test_apply_deltas_mutates_in_place() -> None:
+    loop = LoopInt(3, right=5)
+    result = loop.apply_deltas([1, 1, 1, -4])
+    assert result is loop
+    assert int(loop) == 2
+    assert hash(loop) == hash(2)
+
+    assert int(loop.apply_deltas([])) == 2
+
+    with pytest.raises(TypeError):
+        _ = loop.apply_deltas([LoopInt(1, right=5)])
+
+
+def test_apply_deltas_consumes_generator_once() -> None:
+    consumed: list[int] = []
+
+    def deltas() -> Iterator[int]:
+        for delta in (1, 2, 3):
+            consumed.append(delta)
+            yield delta
+
+    loop = LoopInt(0, right=5)
+    _ = loop.apply_deltas(deltas())
+    assert int(loop) == 1  # 0 + 6 -> 1 (mod 5)
+    assert consumed == [1, 2, 3]
+
+
+def test_apply_deltas_rejects_non_index_and_loopint_subclass_deltas() -> None:
+    class SubLoopInt(LoopInt):
+        __slots__ = ()
+
+    loop = LoopInt(0, right=5)
+    with pytest.raises(TypeError):
+        _ = loop.apply_deltas([1, 1.5])  # pyright: ignore[reportArgumentType]
+
+    with pytest.raises(TypeError):
+        _ = loop.apply_deltas([1, SubLoopInt(1, right=5)])
+
+    assert int(loop) == 0
+
+
+def test_neg_and_rsub_with_non_zero_offset() -> None:
+    x = LoopInt(0, right=2, left=-1)  # [-1; 2), visible = 0
+    assert int(-x) == 0
+    assert int(-LoopInt(1, right=2, left=-1)) == -1  # -1 stays in [-1; 2)
+
+    y = LoopInt(4, right=7, left=2)  # [2; 7), visible = 4
+    assert int(-y) == 6  # -4 -> 6 (mod 5)
+    assert int(10 - y) == 6
+    assert int(0 - y) == 6
+    assert (10 - y).left == 2
+    assert (10 - y).right == 7
+
+
+def test_hash_matches_int_at_edge_values() -> None:
+    # hash(-1) == -2 and large ints are reduced modulo sys.hash_info.modulus.
+    for value in (-1, -2, 2**61 - 1, 2**61, 2**62, -(2**62)):
+        loop = LoopInt(value, right=value + 1, left=value)
+        assert hash(loop) == hash(value)
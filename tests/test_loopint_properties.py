@@ -97,3 +97,54 @@ def test_copy_preserves_invariants(params: LoopParams) -> None:
     clone += 1
 
     assert int(loop) == original_value
+
+
+@given(loop_params(), st.lists(st.integers(min_value=-10_000, max_value=10_000), max_size=50))
+def test_step_many_matches_repeated_iadd(params: LoopParams, deltas: list[int]) -> None:
+    current, left, right = params
+    loop = LoopInt(current, right=right, left=left)
+    clone = copy(loop)
+
+    expected: list[int] = []
+    for delta in deltas:
+        clone += delta
+        expected.append(int(clone))
+
+    assert loop.step_many(deltas) == expected
+
+
+@given(loop_params(), st.integers(min_value=-10_000, max_value=10_000), st.integers(min_value=-100, max_value=3000))
+def test_fold_range_matches_per_number_wrap(params: LoopParams, start: int, count: int) -> None:
+    _, left, right = params
+    loop = LoopInt(left, right=right, left=left)
+
+    stop = start + count
+    expected = [int(LoopInt(i, right=right, left=left)) for i in range(start, stop)]
+
+    assert loop.fold_range(start, stop) == expected
+
+
+@given(loop_params(), st.lists(st.integers(min_value=-10_000, max_value=10_000), max_size=50))
+def test_apply_deltas_matches_repeated_iadd(params: LoopParams, deltas: list[int]) -> None:
+    current, left, right = params
+    loop = LoopInt(current, right=right, left=left)
+    clone = copy(loop)
+
+    for delta in deltas:
+        clone += delta
+
+    _ = loop.apply_deltas(deltas)
+
+    assert int(loop) == int(clone)
+
+
+@given(loop_params(), st.integers(min_value=-10_000, max_value=10_000))
+def test_neg_and_rsub_correspond_to_modular_arithmetic(params: LoopParams, other: int) -> None:
+    current, left, right = params
+    loop = LoopInt(current, right=right, left=left)
+
+    span = loop.span
+    value = int(loop)
+
+    assert int(-loop) == left + (-value - left) % span
+    assert int(other - loop) == left + (other - value - left) % span